@@ -27,12 +27,22 @@ class ColorEngine:
         # Current color modes
         self.neon_mode = True
         
+        # Incremented whenever a rendered parameter may have changed
+        self.version = 0
+        # (version, rgb) of the last get_rgb() conversion
+        self._rgb_cache = (-1, None)
+        
         # Animation system
         self.target_hue = 0.0
         self.target_saturation = 1.0
         self.target_brightness = 1.0
         self.target_fluorescence = 0.0
         self.target_neon_mode = True
+        # Values each animation starts from, so progress depends only on time
+        self.start_hue = self.hue
+        self.start_saturation = self.saturation
+        self.start_brightness = self.brightness
+        self.start_fluorescence = self.fluorescence
         
         # Animation state
         self.animation_duration = 0.5  # seconds
@@ -47,28 +57,35 @@ class ColorEngine:
     def set_hue(self, hue):
         """Set the hue value (0-360 degrees)"""
         self.hue = max(0.0, min(360.0, hue))
+        self.version += 1
         
     def set_saturation(self, saturation):
         """Set the saturation value (0.0-1.0)"""
         self.saturation = max(0.0, min(1.0, saturation))
+        self.version += 1
         
     def set_brightness(self, brightness):
         """Set the brightness value (0.0-1.0)"""
         self.brightness = max(0.0, min(1.0, brightness))
+        self.version += 1
         
     def set_fluorescence(self, fluorescence):
         """Set the fluorescence value (0.0-1.0)"""
         self.fluorescence = max(0.0, min(1.0, fluorescence))
+        self.version += 1
         
     def set_neon_mode(self, neon_mode):
         """Set whether in neon mode (True) or anti-neon mode (False)"""
         self.neon_mode = neon_mode
+        self.version += 1
         
     def set_halo_width(self, w):
         self.halo_width = float(max(0.02, min(0.4, w)))
+        self.version += 1
         
     def set_halo_intensity(self, i):
         self.halo_intensity = float(max(0.0, min(2.0, i)))
+        self.version += 1
         
     def get_hsv(self):
         """Get current HSV values based on mode"""
@@ -85,6 +102,12 @@ class ColorEngine:
     
     def get_rgb(self):
         """Convert current HSV values to RGB (0-1 range)"""
+        # Renderer, UI and export may all ask within one frame; convert once
+        # per state change
+        version, rgb = self._rgb_cache
+        if version == self.version:
+            return rgb
+        
         h, s, v = self.get_hsv()
         
         # HSV to RGB conversion algorithm
@@ -106,8 +129,10 @@ class ColorEngine:
             r, g, b = t, p, v
         else:
             r, g, b = v, p, q
-            
-        return (r, g, b)
+        
+        rgb = (r, g, b)
+        self._rgb_cache = (self.version, rgb)
+        return rgb
     
     def get_bloom_intensity(self):
         """Calculate bloom effect intensity based on current settings"""
@@ -160,6 +185,10 @@ class ColorEngine:
         self.animation_start_time = time.time()
         self.animation_duration = duration
         self.is_animating = True
+        self.start_hue = self.hue
+        self.start_saturation = self.saturation
+        self.start_brightness = self.brightness
+        self.start_fluorescence = self.fluorescence
         
         if target_hue is not None:
             self.target_hue = max(0.0, min(360.0, target_hue))
@@ -180,15 +209,17 @@ class ColorEngine:
         current_time = time.time()
         elapsed = current_time - self.animation_start_time
         progress = min(elapsed / self.animation_duration, 1.0)
+        before = (self.hue, self.saturation, self.brightness, self.fluorescence, self.neon_mode)
         
         # Smooth easing function (ease-out cubic)
         eased_progress = 1.0 - (1.0 - progress) ** 3
         
-        # Interpolate values
-        self.hue = self._lerp_angle(self.hue, self.target_hue, eased_progress)
-        self.saturation = self._lerp(self.saturation, self.target_saturation, eased_progress)
-        self.brightness = self._lerp(self.brightness, self.target_brightness, eased_progress)
-        self.fluorescence = self._lerp(self.fluorescence, self.target_fluorescence, eased_progress)
+        # Interpolate from the start values, so the result depends only on
+        # elapsed time and not on how often this is called
+        self.hue = self._lerp_angle(self.start_hue, self.target_hue, eased_progress)
+        self.saturation = self._lerp(self.start_saturation, self.target_saturation, eased_progress)
+        self.brightness = self._lerp(self.start_brightness, self.target_brightness, eased_progress)
+        self.fluorescence = self._lerp(self.start_fluorescence, self.target_fluorescence, eased_progress)
         
         # Handle mode switching with a delay
         if progress > 0.5 and self.neon_mode != self.target_neon_mode:
@@ -203,6 +234,10 @@ class ColorEngine:
             self.brightness = self.target_brightness
             self.fluorescence = self.target_fluorescence
             self.neon_mode = self.target_neon_mode
+        
+        # Only count steps that actually moved a value
+        if before != (self.hue, self.saturation, self.brightness, self.fluorescence, self.neon_mode):
+            self.version += 1
     
     def start_demo_mode(self):
         """Start automatic demo mode with color cycling"""
@@ -0,0 +1,136 @@
+#version 330
+
+// Input from vertex shader
+in vec2 fragTexCoord;
+
+// Output color
+out vec4 fragColor;
+
+// Uniforms
+uniform int u_mode;             // 0 = neon, 1 = anti-neon
+
+// Neon uniforms, uploaded together as one std140 block (members ordered so
+// the floats fill the padding after each vec3)
+layout(std140) uniform NeonParams {
+    vec3 core_color;       // Core color (RGB)
+    float halo_width;      // Width of the halo ring (0.02 - 0.4)
+    vec3 halo_color;       // Halo color (RGB)
+    float halo_intensity;  // Intensity multiplier for halo (0.0 - 2.0)
+    float bloom_intensity; // Additional bloom/glow effect strength
+};
+
+// Anti-neon uniforms
+uniform vec3 base_color;        // Base color (RGB)
+uniform float shadow_intensity; // Intensity of shadow effect
+
+vec4 neon(float dist) {
+    // Core region parameters
+    const float core_radius = 0.46;       // base circle radius
+    float core_edge = 0.02;               // edge softness for core
+
+    // Core mask (smooth edge)
+    float core = 1.0 - smoothstep(core_radius, core_radius + core_edge, dist);
+
+    // Halo mask: ring around the core
+    float halo_outer = core_radius + halo_width;
+    float halo = smoothstep(core_radius, core_radius + 0.5 * halo_width, dist)
+               * (1.0 - smoothstep(core_radius + 0.5 * halo_width, halo_outer, dist));
+
+    // Base color composition
+    vec3 color = core_color * core + halo_color * halo * halo_intensity;
+
+    // Bloom: extend glow beyond halo using multiple falloffs
+    float bloom1 = 1.0 - smoothstep(core_radius, core_radius + halo_width * 1.6, dist);
+    float bloom2 = 1.0 - smoothstep(core_radius + halo_width * 0.8, core_radius + halo_width * 2.2, dist);
+    float bloom = (bloom1 * 0.7 + bloom2 * 0.3) * bloom_intensity;
+
+    // Apply bloom to halo color only (preserve dark core if desired)
+    color += halo_color * bloom * halo_intensity * 0.6;
+
+    // Subtle chromatic aberration on far glow for richness
+    if (dist > core_radius + halo_width * 0.6) {
+        float t = clamp((dist - (core_radius + halo_width * 0.6)) / (0.6 - halo_width * 0.6), 0.0, 1.0);
+        color.r *= 1.0 + t * 0.25;
+        color.b *= 1.0 - t * 0.15;
+    }
+
+    // Gentle non-linear brightness for "neon" feel
+    color = sqrt(color * 0.8);
+
+    // Final alpha: stronger where either core or halo present
+    float alpha = clamp(core + halo + bloom * 0.5, 0.0, 1.0);
+
+    return vec4(clamp(color, 0.0, 1.0), alpha);
+}
+
+vec4 antineon(float dist) {
+    // Create circular shape with soft edges - use faster approximation
+    // Precompute edge values
+    const float inner_edge = 0.43;
+    const float outer_edge = 0.57;
+    float circle = 1.0 - clamp((dist - inner_edge) / (outer_edge - inner_edge), 0.0, 1.0);
+
+    // Enhanced shadow effect with multiple layers
+    // Use linear interpolation instead of smoothstep for better performance
+    const float shadow_inner = 0.35;
+    const float shadow_outer = 0.65;
+    float shadow = clamp((dist - shadow_inner) / (shadow_outer - shadow_inner), 0.0, 1.0) * shadow_intensity;
+
+    // Add secondary shadow for more depth
+    const float shadow2_inner = 0.55;
+    const float shadow2_outer = 0.75;
+    float shadow2 = clamp((dist - shadow2_inner) / (shadow2_outer - shadow2_inner), 0.0, 1.0) * shadow_intensity * 0.5;
+
+    // Combine shadow effects
+    float total_shadow = shadow + shadow2;
+
+    // Calculate final intensity
+    float intensity = circle - total_shadow * 0.4;
+
+    // Enhanced desaturation for anti-neon effect - use dot product for luminance
+    float luminance = dot(base_color, vec3(0.299, 0.587, 0.114));
+    vec3 desaturated = base_color * 0.7 + vec3(luminance) * 0.3;
+
+    // Reduce brightness with subtle variation
+    desaturated *= 0.7;
+
+    // Add subtle ambient highlighting to maintain visual interest
+    // Replace expensive pow with simpler calculations
+    float highlight = (1.0 - dist * 1.5);
+    highlight = highlight * highlight * highlight; // cube instead of pow
+    highlight = clamp(highlight, 0.0, 1.0);
+
+    // Add subtle rim lighting for more depth
+    float rim = 1.0 - abs(dist - 0.8) * 5.0;
+    rim = clamp(rim, 0.0, 1.0);
+    rim *= rim; // Square for tighter falloff
+
+    vec3 finalColor = mix(desaturated, desaturated * 1.1, highlight);
+    finalColor += vec3(rim * 0.1) * (1.0 - shadow_intensity); // Subtle rim light
+
+    // Add very subtle noise for texture
+    vec2 noise_coord = fragTexCoord * 30.0;
+    float noise = fract(sin(dot(noise_coord, vec2(12.9898, 78.233))) * 43758.5453);
+    noise = (noise - 0.5) * 0.01; // Very subtle noise
+    finalColor += vec3(noise) * 0.3;
+
+    // Clamp final color
+    finalColor = clamp(finalColor, 0.0, 1.0);
+
+    // Output final color with alpha
+    return vec4(finalColor * intensity, intensity);
+}
+
+void main() {
+    // Calculate distance from center
+    vec2 center = vec2(0.5, 0.5);
+    vec2 delta = fragTexCoord - center;
+    float dist = length(delta);
+
+    // Modes are mutually exclusive per draw, so the branch is uniform
+    if (u_mode == 0) {
+        fragColor = neon(dist);
+    } else {
+        fragColor = antineon(dist);
+    }
+}